@@ -1,8 +1,17 @@
-import streamlit as st
-import pandas as pd
+import csv
+import functools
+import io
+import itertools
+import math
 import re
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import streamlit as st
+import pandas as pd
+
 # ---------------------------------------------------------
 # Streamlit config
 # ---------------------------------------------------------
@@ -14,53 +23,364 @@ st.title("🛢️ Webb Environmental – UST Facility Lookup")
 # ---------------------------------------------------------
 BASE_URL = "https://raw.githubusercontent.com/webbenv/UST_Lookup/main/data/"
 
-@st.cache_data
+# Shared digit-strip pattern, compiled once instead of per call/cell.
+_NON_DIGIT_RE = re.compile(r"\D")
+
+# Trailing float artifact ("12345.0") left by spreadsheet exports of zip codes
+_DOT_ZERO_RE = re.compile(r"\.0$")
+
+# Leading separators left over when slicing the "pipe material" column prefix
+_LEAD_SYMS_RE = re.compile(r"^[\s:,-]+")
+
+# Values the source files use for "checked" flags (shared by load-time
+# derivation and the scalar is_truthy helper)
+_TRUTHY = frozenset({"y", "yes", "true", "t", "1", "x"})
+
+def clean_tank_series(series):
+    # digits-only so R1/RA2/1M → 1/2/1 — one vectorized pass, NaN → ""
+    return series.astype(str).str.replace(_NON_DIGIT_RE, "", regex=True).fillna("")
+
+# Compiled once; matches "facility…id" (either order) in a single pass per name.
+_FAC_COL_RE = re.compile(r"facility.*id|id.*facility")
+_FAC_COL_VARIANTS = frozenset(["facid", "facilityid", "fac_id", "fac id", "site id", "siteid"])
+
+# Memoized per column-set: the cached DataFrames never change columns within a
+# session, so the scan only runs once per table instead of on every rerun.
+@functools.lru_cache(maxsize=64)
+def _find_facility_column_cached(cols):
+    result = fallback = None
+    # One pass: prefer facility+id columns, remember the first common variant
+    for col in cols:
+        cl = col.lower()
+        if _FAC_COL_RE.search(cl):
+            result = col
+            break
+        if fallback is None and cl in _FAC_COL_VARIANTS:
+            fallback = col
+    return result if result is not None else fallback
+
+def find_facility_column(df):
+    if df is None or df.empty or not hasattr(df, "columns"):
+        return None
+    return _find_facility_column_cached(tuple(df.columns))
+
+# Columns each file actually feeds into the UI (post-normalization names).
+# Passing these as usecols lets the parser skip unused fields entirely; dtype=str
+# avoids the double-pass dtype inference (ids are re-typed after load).
+TANKS_COLS = frozenset([
+    "owner id", "facility id", "tank number", "federally regulated tank",
+    "install date", "date closed", "capacity", "contents", "other contents",
+    "tank status", "tank type", "facility name", "address",
+])
+OWNER_COLS = frozenset([
+    "owner id", "facility id", "name", "owner name", "site name",
+    "owner address 1", "owner city", "owner state", "owner zip", "owner type",
+])
+MATERIALS_COLS = frozenset(["owner id", "facility id", "tank number", "tank status"])
+MATERIALS_PREFIXES = ("tank material",)
+RELEASE_COLS = frozenset(["owner id", "facility id", "tank number", "tank status"])
+RELEASE_PREFIXES = ("tank rd", "pipe rd")
+SITEINFO_COLS = frozenset([
+    "fac id", "name", "address 1", "address 2", "city", "state", "zip 5",
+    "county", "fac type", "region",
+])
+
+# On-disk Parquet snapshots: the first parse of each source writes a columnar
+# copy, so cold starts (process restart, cache eviction) read Parquet locally
+# instead of re-downloading and re-parsing CSV/XLSX.
+CACHE_DIR = Path.home() / ".ust_cache"
+
+def _parquet_cache_path(url):
+    return CACHE_DIR / (Path(url.rsplit("/", 1)[-1]).stem + ".parquet")
+
+def _load_parquet_snapshot(url, max_age=86400):
+    # Snapshots older than a day are skipped so pushed data gets re-pulled;
+    # max_age=None serves any age (fallback when the download itself fails).
+    path = _parquet_cache_path(url)
+    if path.exists():
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            pass  # corrupt/partial snapshot — reparse the source
+    return None
+
+def _save_parquet_snapshot(url, df):
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(_parquet_cache_path(url))
+    except Exception:
+        pass  # snapshotting is best-effort; never fail the load over it
+
+def _normalize_columns(df):
+    # Lowercase, strip, collapse spaces — done inside the cached loaders so it
+    # runs once per parse instead of on every Streamlit rerun.
+    if not df.empty:
+        df.columns = df.columns.str.lower().str.strip().str.replace(r"\s+", " ", regex=True)
+    return df
+
+def _parse_csv_bytes(raw, keep=None, keep_prefixes=()):
+    cols = None
+    if keep is not None:
+        # Resolve the wanted columns against the real header up front: the
+        # pyarrow engine takes a concrete name list, not a callable.
+        header_line = raw.decode("utf-8-sig", "replace").split("\n", 1)[0]
+        header = next(csv.reader(io.StringIO(header_line)))
+        def wanted(c):
+            name = re.sub(r"\s+", " ", str(c)).strip().lower()
+            return name in keep or (bool(keep_prefixes) and name.startswith(keep_prefixes))
+        cols = [c for c in header if wanted(c)] or None
+    try:
+        # PyArrow's multi-threaded block parser; much faster on the big files
+        df = pd.read_csv(io.BytesIO(raw), usecols=cols, dtype=str, engine="pyarrow")
+    except Exception:
+        df = pd.read_csv(io.BytesIO(raw), usecols=cols, dtype=str, low_memory=False)
+    return _normalize_columns(df)
+
+# Per-file cached readers: each file is parsed once per session and cached
+# independently, so a rerun (every keystroke) never re-hits the CSV parser.
+@st.cache_data(show_spinner=False)
+def _read_csv(url, keep=None, keep_prefixes=(), version=None):
+    # version only keys the cache: load_data passes the current day index so a
+    # ttl refresh re-enters here instead of serving a frozen entry forever.
+    cached = _load_parquet_snapshot(url)
+    if cached is not None:
+        return cached
+    try:
+        raw = urllib.request.urlopen(url).read()
+    except Exception:
+        # Download failed — a stale snapshot beats failing the whole load
+        stale = _load_parquet_snapshot(url, max_age=None)
+        if stale is not None:
+            return stale
+        raise
+    df = _parse_csv_bytes(raw, keep, keep_prefixes)
+    _save_parquet_snapshot(url, df)
+    return df
+
+# Local fallback (the repo ships /data): cached on path+mtime so the disk CSV
+# is only reparsed when the file actually changes.
+DATA_DIR = Path(__file__).parent / "data"
+
+@st.cache_data(show_spinner=False)
+def _read_local_csv(name, mtime, keep=None, keep_prefixes=()):
+    return _parse_csv_bytes((DATA_DIR / name).read_bytes(), keep, keep_prefixes)
+
+def _load_siteinfo_local():
+    path = DATA_DIR / "SiteInfo.csv"
+    if path.exists():
+        try:
+            return _read_local_csv("SiteInfo.csv", path.stat().st_mtime_ns, SITEINFO_COLS)
+        except Exception:
+            pass
+    return pd.DataFrame()
+
+@st.cache_data(show_spinner=False)
+def _read_excel(url, version=None):
+    cached = _load_parquet_snapshot(url)
+    if cached is not None:
+        return cached
+    try:
+        # Rust-backed reader, far faster than openpyxl's pure-Python XML parse.
+        # dtype=str matches the CSV loaders and keeps the columns Parquet-safe:
+        # Excel inference yields mixed int/str cells that to_parquet rejects.
+        df = pd.read_excel(url, engine="calamine", dtype=str)
+    except Exception:
+        try:
+            df = pd.read_excel(url, engine="openpyxl", dtype=str)
+        except Exception:
+            stale = _load_parquet_snapshot(url, max_age=None)
+            if stale is not None:
+                return stale
+            raise
+    df = _normalize_columns(df)
+    _save_parquet_snapshot(url, df)
+    return df
+
+def _derive_columns(tanks, owner, ustpipe, usttankmaterials, ustpipe_release, siteinfo):
+    """Attach every derived/search column in place, once per cached load.
+
+    Runs inside load_data() so none of this work repeats on Streamlit reruns.
+    """
+    # Canonical digits-only facility id, built once (vectorized) so the per-tank
+    # narrowing in the render path is a plain equality instead of a regex per lookup.
+    for df in [ustpipe, usttankmaterials, ustpipe_release]:
+        if not df.empty and "facility id" in df.columns:
+            df["clean_facility_id"] = df["facility id"].astype(str).str.replace(_NON_DIGIT_RE, "", regex=True)
+
+    # Pre-normalize the materials / pipe / RD join key here as well, so the render
+    # path never copies the aux frames just to attach a derived column.
+    for df in [ustpipe, usttankmaterials, ustpipe_release]:
+        if not df.empty and "tank number" in df.columns:
+            df["clean_tank_number"] = clean_tank_series(df["tank number"])
+
+    # "CURR IN USE" resolved to a plain bool column up front, so status filters in
+    # the render path are boolean masks instead of case-folded substring scans.
+    for df in [tanks, usttankmaterials, ustpipe]:
+        if not df.empty and "tank status" in df.columns:
+            df["_is_curr_in_use"] = df["tank status"].astype(str).str.contains("CURR IN USE", case=False, na=False)
+            # Status labels are low-cardinality: categorical storage keeps one
+            # copy of each label plus int8 codes (display reads are unchanged)
+            df["tank status"] = df["tank status"].astype("category")
+
+    # Lowercased copies of the tanks search columns, so the name/address fallback
+    # is a plain C substring pass (regex=False) with no per-keystroke re-casting.
+    if not tanks.empty:
+        if "facility name" in tanks.columns:
+            tanks["_name_lower"] = tanks["facility name"].astype(str).str.lower()
+        if "address" in tanks.columns:
+            tanks["_addr_lower"] = tanks["address"].astype(str).str.lower()
+
+    # One lowercased haystack per owner row (names + formatted address), built once
+    # so the name/address fallback is a single substring pass instead of a fresh
+    # case-folded scan per column per keystroke.
+    if not owner.empty:
+        blob_parts = [owner[c].astype(str) for c in ["name", "owner name", "site name"] if c in owner.columns]
+        if all(x in owner.columns for x in ["owner address 1", "owner city", "owner state", "owner zip"]):
+            blob_parts.append(
+                owner["owner address 1"].astype(str).str.strip() + ", " +
+                owner["owner city"].astype(str).str.strip() + ", " +
+                owner["owner state"].astype(str).str.strip() + " " +
+                owner["owner zip"].astype(str).str.strip()
+            )
+        if blob_parts:
+            blob = blob_parts[0]
+            for part in blob_parts[1:]:
+                blob = blob + " | " + part
+            owner["_search_blob"] = blob.str.lower()
+
+    # Same prebuilt haystack for siteinfo, so the last-resort fallback never has
+    # to copy the frame or rebuild full_address inside a rerun.
+    if not siteinfo.empty:
+        site_parts = [siteinfo[c].astype(str) for c in ["name", "site name"] if c in siteinfo.columns]
+        site_cols = siteinfo.columns
+        street = next((c for c in ["site address 1","site address","address 1","address","facility address 1","facility address"] if c in site_cols), None)
+        city   = next((c for c in ["site city","city","facility city"] if c in site_cols), None)
+        state  = next((c for c in ["site state","state","facility state"] if c in site_cols), None)
+        zip5   = next((c for c in ["site zip","zip","zipcode","zip code","zip 5","facility zip"] if c in site_cols), None)
+        if all([street, city, state, zip5]):
+            site_parts.append(
+                siteinfo[street].astype(str).str.strip() + ", " +
+                siteinfo[city].astype(str).str.strip() + ", " +
+                siteinfo[state].astype(str).str.strip() + " " +
+                siteinfo[zip5].astype(str).str.strip()
+            )
+        if site_parts:
+            blob = site_parts[0]
+            for part in site_parts[1:]:
+                blob = blob + " | " + part
+            siteinfo["_search_blob"] = blob.str.lower()
+
+    # Zip and capacity display values normalized column-wise, so the render
+    # path just reads precomputed strings (mirrors normalize_zip/format_capacity).
+    def _zip_norm(series):
+        z = series.astype(str).str.strip().str.replace(_DOT_ZERO_RE, "", regex=True)
+        return z.mask(z.str.isdigit() & (z.str.len() <= 5), z.str.zfill(5))
+
+    if not owner.empty and "owner zip" in owner.columns:
+        owner["_zip_norm"] = _zip_norm(owner["owner zip"])
+    if not siteinfo.empty and zip5:
+        siteinfo["_zip_norm"] = _zip_norm(siteinfo[zip5])
+    if not tanks.empty and "capacity" in tanks.columns:
+        cap_num = pd.to_numeric(tanks["capacity"], errors="coerce")
+        tanks["_capacity_fmt"] = [f"{int(n):,}" if pd.notna(n) else str(v)
+                                  for n, v in zip(cap_num, tanks["capacity"])]
+
+    # Same treatment for the pipe-material flags: a per-row list of the raw
+    # material labels whose cells are truthy, so the tank loop never re-masks
+    # the material columns.
+    if not ustpipe.empty:
+        mat_cols = [c for c in ustpipe.columns if str(c).lower().startswith("pipe material")]
+        if mat_cols:
+            mat_names = [_LEAD_SYMS_RE.sub("", str(c)[len("pipe material"):].strip())
+                         for c in mat_cols]
+            mask = ustpipe[mat_cols].astype(str).apply(lambda s: s.str.strip().str.lower()).isin(_TRUTHY).to_numpy()
+            ustpipe["_pipe_materials"] = [list(itertools.compress(mat_names, row)) for row in mask]
+
+    # Truthy RD flags resolved to a per-row list of display names up front, so
+    # the render path unions tiny lists instead of re-masking the RD columns
+    # for every tank.
+    if not ustpipe_release.empty:
+        for prefix, dest in [("tank rd ", "_tank_rd_methods"), ("pipe rd ", "_pipe_rd_methods")]:
+            cols = [c for c in ustpipe_release.columns if str(c).lower().startswith(prefix)]
+            if cols:
+                names = [c[len(prefix):].strip().title() for c in cols]
+                mask = ustpipe_release[cols].astype(str).apply(lambda s: s.str.strip().str.upper()).eq("Y").to_numpy()
+                ustpipe_release[dest] = [list(itertools.compress(names, row)) for row in mask]
+
+    # Nullable Int64 ids where the column is cleanly numeric: equality filters then
+    # run as vectorized integer compares instead of str-casting the whole column.
+    for df in [tanks, owner, usttankmaterials, ustpipe_release, siteinfo]:
+        if not df.empty:
+            id_cols = ["facility id", "owner id"]
+            # Whatever column the lookups will treat as the facility id must be
+            # converted too (siteinfo names it "fac id"), or the isin joins
+            # compare strings against Int64 and silently match nothing.
+            fac_col = find_facility_column(df)
+            if fac_col and fac_col not in id_cols:
+                id_cols.append(fac_col)
+            for col in id_cols:
+                if col in df.columns:
+                    as_num = pd.to_numeric(df[col], errors="coerce")
+                    if as_num.notna().sum() == df[col].notna().sum():
+                        df[col] = as_num.astype("Int64")
+
+# persist="disk" keeps the prepared frames across process restarts (on top of
+# the raw Parquet snapshots); ttl re-pulls from GitHub at most daily.
+@st.cache_data(persist="disk", ttl=86400, show_spinner="Loading UST data…")
 def load_data():
     try:
-        tanks = pd.read_csv(BASE_URL + "tanks.csv", low_memory=False)
-        owner = pd.read_csv(BASE_URL + "owner.csv", low_memory=False)
-        ustpipe = pd.read_excel(BASE_URL + "ustpipematerials.xlsx", engine="openpyxl")
-        usttankmaterials = pd.read_csv(BASE_URL + "usttankmaterials.csv", low_memory=False)
-        ustpipe_release = pd.read_csv(BASE_URL + "usttankpipereleasedetection.csv", low_memory=False)
-        # SiteInfo is optional but present per your note
+        # Day-granular fetch key: when the 24h ttl lapses, this changes and
+        # busts the per-file reader caches so pushed data is actually re-read.
+        fetch_day = int(time.time() // 86400)
+        # All six fetches run concurrently: the GIL is released during socket
+        # reads, so cold-start wall time is the slowest file, not the sum.
+        with ThreadPoolExecutor(max_workers=6) as ex:
+            f_tanks = ex.submit(_read_csv, BASE_URL + "tanks.csv", TANKS_COLS, version=fetch_day)
+            f_owner = ex.submit(_read_csv, BASE_URL + "owner.csv", OWNER_COLS, version=fetch_day)
+            f_pipe = ex.submit(_read_excel, BASE_URL + "ustpipematerials.xlsx", version=fetch_day)
+            f_mats = ex.submit(_read_csv, BASE_URL + "usttankmaterials.csv", MATERIALS_COLS, MATERIALS_PREFIXES, version=fetch_day)
+            f_rel = ex.submit(_read_csv, BASE_URL + "usttankpipereleasedetection.csv", RELEASE_COLS, RELEASE_PREFIXES, version=fetch_day)
+            # SiteInfo is optional but present per your note
+            f_site = ex.submit(_read_csv, BASE_URL + "SiteInfo.csv", SITEINFO_COLS, version=fetch_day)
+        tanks = f_tanks.result()
+        owner = f_owner.result()
+        ustpipe = f_pipe.result()
+        usttankmaterials = f_mats.result()
+        ustpipe_release = f_rel.result()
         try:
-            siteinfo = pd.read_csv(BASE_URL + "SiteInfo.csv", low_memory=False)
+            siteinfo = f_site.result()
         except Exception:
-            siteinfo = pd.DataFrame()
-        return tanks, owner, ustpipe, usttankmaterials, ustpipe_release, siteinfo
+            siteinfo = _load_siteinfo_local()
+        _derive_columns(tanks, owner, ustpipe, usttankmaterials, ustpipe_release, siteinfo)
+        # Version token for the downstream index/resolver caches: changes each
+        # time this body actually recomputes (ttl lapse, cache clear), so
+        # positional indexes never outlive the frames they were built from.
+        return tanks, owner, ustpipe, usttankmaterials, ustpipe_release, siteinfo, time.time()
     except Exception as e:
         st.error(f"⚠️ Error loading data: {e}")
-        return (pd.DataFrame(),)*6
+        return (pd.DataFrame(),)*6 + (0.0,)
 
-tanks, owner, ustpipe, usttankmaterials, ustpipe_release, siteinfo = load_data()
+tanks, owner, ustpipe, usttankmaterials, ustpipe_release, siteinfo, DATA_VERSION = load_data()
 
-# Normalize column names everywhere (lowercase, strip, collapse spaces)
-for df in [tanks, owner, ustpipe, usttankmaterials, ustpipe_release, siteinfo]:
-    if not df.empty:
-        df.columns = df.columns.str.lower().str.strip().str.replace(r"\s+", " ", regex=True)
+# Captured once per rerun instead of re-checking .empty inside the hot branch
+DATA_LOADED = not (tanks.empty or owner.empty)
 
 # ---------------------------------------------------------
 # Search input (main UI)
 # ---------------------------------------------------------
-facility_input = st.text_input("Search by Facility ID, Site Name, or Address:")
+# Form-gated input: the script reruns on submit (Enter or the button), not on
+# every keystroke, so partial queries never trigger a search.
+with st.form("lookup"):
+    facility_input = st.text_input("Search by Facility ID, Site Name, or Address:")
+    st.form_submit_button("Search")
 
 # ---------------------------------------------------------
 # Helpers (kept consistent with your working code)
 # ---------------------------------------------------------
-def find_facility_column(df):
-    if df is None or df.empty or not hasattr(df, "columns"):
-        return None
-    # Prefer any col containing facility + id
-    for col in df.columns:
-        cl = col.lower()
-        if "facility" in cl and "id" in cl:
-            return col
-    # Fallback common variants
-    for cand in ["facid", "facilityid", "fac_id", "fac id", "site id", "siteid"]:
-        if cand in df.columns:
-            return cand
-    return None
-
+# Memoized: the same owner/site zips recur on every Streamlit rerun.
+@functools.lru_cache(maxsize=1024)
 def normalize_zip(val):
     s = str(val).strip()
     if s.endswith('.0'):
@@ -69,16 +389,8 @@ def normalize_zip(val):
         s = s.zfill(5)
     return s
 
-def clean_tank_number(val):
-    if pd.isna(val):
-        return ""
-    s = str(val).strip()
-    # digits-only so R1/RA2/1M → 1/2/1
-    return re.sub(r"[^0-9]", "", s)
-
 def is_truthy(val):
-    s = str(val).strip().lower()
-    return s in {"y","yes","true","t","1","x"}
+    return str(val).strip().lower() in _TRUTHY
 
 def format_capacity(value):
     try:
@@ -89,17 +401,139 @@ def format_capacity(value):
     except Exception:
         return str(value)
 
+def filter_by_id(df, col, value):
+    # Fast integer path when the id column was converted to Int64 at load
+    if pd.api.types.is_integer_dtype(df[col]):
+        num = pd.to_numeric(str(value).strip(), errors="coerce")
+        # Non-numeric, infinite and non-integral queries ("abc", "inf",
+        # "123.5") match nothing rather than overflowing or truncating to a
+        # different facility's id.
+        if pd.isna(num) or not math.isfinite(num) or num != int(num):
+            return df.iloc[0:0]
+        return df[df[col] == int(num)]
+    return df[df[col].astype(str).str.strip() == str(value).strip()]
+
+def filter_by_id_list(df, col, values):
+    # isin join tolerant of dtype drift: when only one side's id column passed
+    # the clean-numeric test at load, align the values to the column's dtype
+    # instead of silently matching nothing.
+    if pd.api.types.is_integer_dtype(df[col]):
+        nums = pd.to_numeric(pd.Series(list(values)), errors="coerce").dropna()
+        return df[df[col].isin(nums.astype("int64").tolist())]
+    return df[df[col].astype(str).str.strip().isin({str(v).strip() for v in values})]
+
+# id → row-positions maps, rebuilt only when the data version changes
+# (cache_resource keeps the live dicts; the leading-underscore arg opts out
+# of Streamlit's hashing, so the version token is what keys the cache).
+@st.cache_resource(show_spinner=False)
+def _build_id_indexes(_tables, version):
+    out = {}
+    for name, df in _tables.items():
+        col = find_facility_column(df)
+        if col and pd.api.types.is_integer_dtype(df[col]):
+            out[name] = df.groupby(col, sort=False).indices
+    return out
+
+def lookup_by_id(name, df, value):
+    # O(1) probe of the prebuilt index; falls back to a filter scan for
+    # tables whose id column stayed non-numeric.
+    rows_map = ID_INDEX.get(name)
+    if rows_map is not None:
+        num = pd.to_numeric(str(value).strip(), errors="coerce")
+        # Same finite/integral guard as filter_by_id: "inf" must not overflow
+        # and "123.5" is not facility 123.
+        if pd.isna(num) or not math.isfinite(num) or num != int(num):
+            return df.iloc[0:0]
+        rows = rows_map.get(int(num))
+        return df.iloc[rows] if rows is not None else df.iloc[0:0]
+    col = find_facility_column(df)
+    if col is None:
+        return df.iloc[0:0]
+    return filter_by_id(df, col, value)
+
 def pick(df, candidates):
     for c in candidates:
         if c in df.columns:
             return c
     return None
 
+# clean tank number → row-positions maps for the three per-tank lookup frames,
+# keyed on the data version like ID_INDEX (live dicts via cache_resource).
+@st.cache_resource(show_spinner=False)
+def _build_tank_indexes(_tables, version):
+    out = {}
+    for name, df in _tables.items():
+        if not df.empty and "clean_tank_number" in df.columns:
+            out[name] = df.groupby("clean_tank_number", sort=False).indices
+    return out
+
+def rows_by_tank(name, df, clean_num):
+    rows = TANK_INDEX.get(name, {}).get(clean_num)
+    return df.iloc[rows] if rows is not None else df.iloc[0:0]
+
+ID_INDEX = _build_id_indexes({
+    "tanks": tanks,
+    "owner": owner,
+    "siteinfo": siteinfo,
+}, DATA_VERSION)
+
+TANK_INDEX = _build_tank_indexes({
+    "usttankmaterials": usttankmaterials,
+    "ustpipe": ustpipe,
+    "ustpipe_release": ustpipe_release,
+}, DATA_VERSION)
+
+# Facility resolution cached per query string plus the data version, so a
+# daily refresh invalidates old results; repeat searches (and the rerun
+# Streamlit fires after every later widget event) skip the fallback scans.
+@st.cache_data(max_entries=256, show_spinner=False)
+def resolve_tanks_filtered(fid_str, version):
+    fac_col_tanks = find_facility_column(tanks)
+    fac_col_owner = find_facility_column(owner)
+    fac_col_site  = find_facility_column(siteinfo) if not siteinfo.empty else None
+
+    tanks_filtered = pd.DataFrame()
+
+    # 1) try Facility ID match (index probe when possible, string filter otherwise)
+    if fac_col_tanks in tanks.columns:
+        tanks_filtered = lookup_by_id("tanks", tanks, fid_str)
+
+    # Substring fallbacks only for 3+ character queries: a submitted short
+    # digit query (e.g. "5") stops at the id probe above rather than
+    # substring-matching thousands of unrelated owners/sites.
+    if tanks_filtered.empty and len(fid_str) >= 3:
+        # 2) fallback: facility name, then address (prebuilt lowercase columns,
+        #    plain substring match — no regex, no per-query casting)
+        fid_lower = fid_str.lower()
+        if "_name_lower" in tanks.columns:
+            tanks_filtered = tanks[tanks["_name_lower"].str.contains(fid_lower, regex=False, na=False)]
+        if tanks_filtered.empty and "_addr_lower" in tanks.columns:
+            tanks_filtered = tanks[tanks["_addr_lower"].str.contains(fid_lower, regex=False, na=False)]
+
+        # 3) fallback via owner by name/address → get facility IDs → filter tanks
+        if tanks_filtered.empty and not owner.empty and fac_col_owner in owner.columns and "_search_blob" in owner.columns:
+            owner_matches = owner[owner["_search_blob"].str.contains(fid_lower, regex=False, na=False)]
+            if not owner_matches.empty and fac_col_tanks in tanks.columns:
+                matched_fids = owner_matches[fac_col_owner].dropna().unique().tolist()
+                if matched_fids:
+                    tanks_filtered = filter_by_id_list(tanks, fac_col_tanks, matched_fids)
+
+        # 4) fallback via SiteInfo (if present)
+        if tanks_filtered.empty and not siteinfo.empty and fac_col_site and fac_col_tanks in tanks.columns \
+                and "_search_blob" in siteinfo.columns:
+            site_matches = siteinfo[siteinfo["_search_blob"].str.contains(fid_lower, regex=False, na=False)]
+            if not site_matches.empty and fac_col_site in site_matches.columns:
+                site_fids = site_matches[fac_col_site].dropna().unique().tolist()
+                if site_fids:
+                    tanks_filtered = filter_by_id_list(tanks, fac_col_tanks, site_fids)
+
+    return tanks_filtered
+
 # ---------------------------------------------------------
 # MAIN FLOW — replicate your working logic, without sidebar
 # ---------------------------------------------------------
 if facility_input:
-    if tanks.empty or owner.empty:
+    if not DATA_LOADED:
         st.error("Data not loaded — verify your GitHub /data folder.")
         st.stop()
 
@@ -107,72 +541,16 @@ if facility_input:
     fac_col_owner = find_facility_column(owner)
     fac_col_site  = find_facility_column(siteinfo) if not siteinfo.empty else None
 
-    tanks_filtered = pd.DataFrame()
     fid_str = str(facility_input).strip()
 
-    # 1) try Facility ID match (string-compare to be robust)
-    if fac_col_tanks in tanks.columns:
-        tanks_filtered = tanks[tanks[fac_col_tanks].astype(str).str.strip() == fid_str]
+    # Streamlit reruns on every keystroke: don't run the substring fallbacks
+    # on 1-2 character fragments. Short all-digit inputs still hit the id
+    # index directly, since facility ids can be that short.
+    if len(fid_str) < 3 and not fid_str.isdigit():
+        st.info("Keep typing — name/address search needs at least 3 characters.")
+        st.stop()
 
-    # 2) fallback: facility name, then address
-    if tanks_filtered.empty:
-        if "facility name" in tanks.columns:
-            tanks_filtered = tanks[tanks["facility name"].astype(str).str.contains(fid_str, case=False, na=False)]
-        if tanks_filtered.empty and "address" in tanks.columns:
-            tanks_filtered = tanks[tanks["address"].astype(str).str.contains(fid_str, case=False, na=False)]
-
-    # 3) fallback via owner by name/address → get facility IDs → filter tanks
-    if tanks_filtered.empty and not owner.empty and fac_col_owner in owner.columns:
-        owner_search = owner.copy()
-        if all(x in owner_search.columns for x in ["owner address 1","owner city","owner state","owner zip"]):
-            owner_search["full_address"] = (
-                owner_search["owner address 1"].astype(str).str.strip() + ", " +
-                owner_search["owner city"].astype(str).str.strip() + ", " +
-                owner_search["owner state"].astype(str).str.strip() + " " +
-                owner_search["owner zip"].astype(str).str.strip()
-            )
-        else:
-            owner_search["full_address"] = ""
-
-        name_cols = [c for c in ["name","owner name","site name"] if c in owner_search.columns]
-        search_cols = name_cols + ["full_address"]
-        if search_cols:
-            mask = None
-            for col in search_cols:
-                col_mask = owner_search[col].astype(str).str.contains(fid_str, case=False, na=False)
-                mask = col_mask if mask is None else (mask | col_mask)
-            owner_matches = owner_search[mask] if mask is not None else pd.DataFrame()
-            if not owner_matches.empty and fac_col_owner in owner_matches.columns and fac_col_tanks in tanks.columns:
-                matched_fids = owner_matches[fac_col_owner].dropna().unique().tolist()
-                if matched_fids:
-                    tanks_filtered = tanks[tanks[fac_col_tanks].isin(matched_fids)]
-
-    # 4) fallback via SiteInfo (if present)
-    if tanks_filtered.empty and not siteinfo.empty and fac_col_site and fac_col_tanks in tanks.columns:
-        si = siteinfo.copy()
-        street_col = pick(si, ["site address 1","site address","address 1","address","facility address 1","facility address"])
-        city_col   = pick(si, ["site city","city","facility city"])
-        state_col  = pick(si, ["site state","state","facility state"])
-        zip_col    = pick(si, ["site zip","zip","zipcode","zip code","zip 5","facility zip"])
-        si["full_address"] = ""
-        if all([street_col,city_col,state_col,zip_col]):
-            si["full_address"] = (
-                si[street_col].astype(str).str.strip() + ", " +
-                si[city_col].astype(str).str.strip() + ", " +
-                si[state_col].astype(str).str.strip() + " " +
-                si[zip_col].astype(str).str.strip()
-            )
-        name_cols = [c for c in ["name","site name"] if c in si.columns]
-        search_cols = name_cols + ["full_address"]
-        mask = None
-        for col in search_cols:
-            col_mask = si[col].astype(str).str.contains(fid_str, case=False, na=False)
-            mask = col_mask if mask is None else (mask | col_mask)
-        site_matches = si[mask] if mask is not None else pd.DataFrame()
-        if not site_matches.empty and fac_col_site in site_matches.columns:
-            site_fids = site_matches[fac_col_site].dropna().unique().tolist()
-            if site_fids:
-                tanks_filtered = tanks[tanks[fac_col_tanks].isin(site_fids)]
+    tanks_filtered = resolve_tanks_filtered(fid_str, DATA_VERSION)
 
     if tanks_filtered.empty:
         st.warning("No facility found for that ID or name.")
@@ -183,7 +561,7 @@ if facility_input:
 
     # ----------------- Owner info -----------------
     if fac_col_owner in owner.columns:
-        owner_filtered = owner[owner[fac_col_owner].astype(str).str.strip() == str(facility_id)]
+        owner_filtered = lookup_by_id("owner", owner, facility_id)
     else:
         owner_filtered = pd.DataFrame()
 
@@ -196,20 +574,20 @@ if facility_input:
             f"{owner_filtered['owner address 1'].iloc[-1]}, "
             f"{owner_filtered['owner city'].iloc[-1]}, "
             f"{owner_filtered['owner state'].iloc[-1]} "
-            f"{normalize_zip(owner_filtered['owner zip'].iloc[-1])}"
+            f"{owner_filtered['_zip_norm'].iloc[-1] if '_zip_norm' in owner_filtered.columns else normalize_zip(str(owner_filtered['owner zip'].iloc[-1]))}"
         )
 
     # ----------------- Site Address (from SiteInfo.csv if available) -----------------
     site_address = "N/A"
     if not siteinfo.empty and fac_col_site in siteinfo.columns:
-        sirow = siteinfo[siteinfo[fac_col_site].astype(str).str.strip() == str(facility_id)]
+        sirow = lookup_by_id("siteinfo", siteinfo, facility_id)
         if not sirow.empty:
             street_col = pick(sirow, ["site address 1","site address","address 1","address","facility address 1","facility address"])
             city_col   = pick(sirow, ["site city","city","facility city"])
             state_col  = pick(sirow, ["site state","state","facility state"])
             zip_col    = pick(sirow, ["site zip","zip","zipcode","zip code","zip 5","facility zip"])
             if all([street_col,city_col,state_col,zip_col]):
-                z = normalize_zip(sirow[zip_col].iloc[-1])
+                z = sirow["_zip_norm"].iloc[-1] if "_zip_norm" in sirow.columns else normalize_zip(str(sirow[zip_col].iloc[-1]))
                 site_address = f"{sirow[street_col].iloc[-1]}, {sirow[city_col].iloc[-1]}, {sirow[state_col].iloc[-1]} {z}"
 
     dealer_id = owner_filtered["owner id"].max() if not owner_filtered.empty and "owner id" in owner_filtered.columns else "N/A"
@@ -227,114 +605,97 @@ if facility_input:
 
     # ----------------- Active Tanks (render like your working layout) -----------------
     st.markdown("### ⛽ Active Tanks")
-    active_tanks = tanks_filtered[tanks_filtered.get("tank status","").astype(str).str.contains("CURR IN USE", case=False, na=False)] \
-                   if "tank status" in tanks_filtered.columns else pd.DataFrame()
+    active_tanks = tanks_filtered[tanks_filtered["_is_curr_in_use"]] \
+                   if "_is_curr_in_use" in tanks_filtered.columns else pd.DataFrame()
 
     if "tank number" in active_tanks.columns:
-        active_tanks = active_tanks.copy()
-        active_tanks["clean_tank_number"] = active_tanks["tank number"].apply(clean_tank_number)
-
-    # Pre-normalize joins for materials / RD
-    if not usttankmaterials.empty and "tank number" in usttankmaterials.columns:
-        usttankmaterials = usttankmaterials.copy()
-        usttankmaterials["clean_tank_number"] = usttankmaterials["tank number"].apply(clean_tank_number)
-
-    if not ustpipe.empty and "tank number" in ustpipe.columns:
-        ustpipe = ustpipe.copy()
-        ustpipe["clean_tank_number"] = ustpipe["tank number"].apply(clean_tank_number)
-
-    if not ustpipe_release.empty and "tank number" in ustpipe_release.columns:
-        ustpipe_release = ustpipe_release.copy()
-        ustpipe_release["clean_tank_number"] = ustpipe_release["tank number"].apply(clean_tank_number)
-
-    # RD extractor (Tank/ Pipe)
-    def extract_rd(df, clean_num, prefix):
+        # assign() is a shallow (copy-on-write) frame, so attaching the derived
+        # column no longer duplicates every tank column in memory.
+        active_tanks = active_tanks.assign(clean_tank_number=clean_tank_series(active_tanks["tank number"]))
+
+    # RD display-name order, derived once per search from the column layout
+    # (the per-row truthy lists themselves are precomputed at load)
+    tank_rd_names = [c[len("tank rd "):].strip().title()
+                     for c in ustpipe_release.columns if str(c).lower().startswith("tank rd ")]
+    pipe_rd_names = [c[len("pipe rd "):].strip().title()
+                     for c in ustpipe_release.columns if str(c).lower().startswith("pipe rd ")]
+
+    # Piping-type / other-specify aliases, resolved once against the pipe table
+    pt_col = next((c for c in ["pipingtype", "piping type"] if c in ustpipe.columns), None)
+    spec_col = "pipe material other specify" if "pipe material other specify" in ustpipe.columns else None
+
+    # Double-wall column alias, resolved once against the materials table
+    dw_col = next((c for c in ["tank material double walled", "double walled", "double wall"]
+                   if c in usttankmaterials.columns), None)
+
+    # Digits-only facility key, computed once per search for the
+    # clean_facility_id narrowing in all three per-tank blocks
+    target_digits = _NON_DIGIT_RE.sub("", str(facility_id))
+
+    # Owner-id fallback key, normalized once (used when a table lacks facility id)
+    current_owner_id = None
+    if not owner_filtered.empty and "owner id" in owner_filtered.columns:
+        current_owner_id = str(owner_filtered["owner id"].iloc[-1]).strip()
+
+    # Shared tank→row narrowing for the materials and pipe tables: index probe,
+    # then same-facility (or owner) preference, exact tank number over legacy
+    # prefixes (e.g. '1' over 'R1'), current in-use status, first remaining.
+    def narrow_candidates(name, df, clean_num, tank_num):
         if df.empty or "clean_tank_number" not in df.columns:
+            return df.iloc[0:0]
+        cands = rows_by_tank(name, df, clean_num)
+        if not cands.empty and "clean_facility_id" in cands.columns:
+            sub = cands[cands["clean_facility_id"] == target_digits]
+            if not sub.empty:
+                cands = sub
+        elif not cands.empty and current_owner_id is not None and "owner id" in cands.columns:
+            # Fallback: use owner id if facility id is unavailable in the table
+            sub = cands[cands["owner id"].astype(str).str.strip() == current_owner_id]
+            if not sub.empty:
+                cands = sub
+        if not cands.empty and "tank number" in cands.columns:
+            exact = cands[cands["tank number"].astype(str).str.strip() == str(tank_num)]
+            if not exact.empty:
+                cands = exact
+        if not cands.empty and "_is_curr_in_use" in cands.columns:
+            cur = cands[cands["_is_curr_in_use"]]
+            if not cur.empty:
+                cands = cur
+        return cands.head(1)
+
+    # RD extractor (Tank/ Pipe) — reads the per-row lists built at load
+    def extract_rd(df, clean_num, dest, names):
+        if df.empty or dest not in df.columns:
             return []
-        subset = df[df["clean_tank_number"] == clean_num]
-        # Prefer same facility if available
-        if not subset.empty and "facility id" in subset.columns:
-            try:
-                target_digits = re.sub(r"\D", "", str(facility_id))
-                ser_digits = subset["facility id"].astype(str).str.replace(r"\D", "", regex=True)
-                subset2 = subset[ser_digits == target_digits]
-                if not subset2.empty:
-                    subset = subset2
-            except Exception:
-                subset2 = subset[subset["facility id"].astype(str).str.strip() == str(facility_id)]
-                if not subset2.empty:
-                    subset = subset2
+        subset = rows_by_tank("ustpipe_release", df, clean_num)
         if subset.empty:
             return []
-        methods = []
-        for c in subset.columns:
-            cl = str(c).lower()
-            if cl.startswith(prefix):
-                colvals = subset[c].astype(str).str.strip().str.upper()
-                if (colvals == "Y").any():
-                    methods.append(c[len(prefix):].strip().title())
-        return methods
+        # Prefer same facility if available
+        if "clean_facility_id" in subset.columns:
+            subset2 = subset[subset["clean_facility_id"] == target_digits]
+            if not subset2.empty:
+                subset = subset2
+        hit = set()
+        for methods in subset[dest]:
+            hit.update(methods)
+        # Keep the original column order for display
+        return [n for n in names if n in hit]
 
     if active_tanks.empty:
         st.info("No active tanks found for this facility.")
     else:
-        for _, row in active_tanks.iterrows():
-            tank_num = row.get("tank number", "N/A")
-            clean_num = row.get("clean_tank_number", str(tank_num))
-            contents = row.get("contents", "N/A")
-            capacity = format_capacity(row.get("capacity", "N/A"))
-            install_date = row.get("install date", "N/A")
-            status = row.get("tank status", "N/A")
-
+        # Plain-tuple iteration over a fixed column order — no per-row Series
+        _TANK_FIELDS = ["tank number", "clean_tank_number", "contents", "_capacity_fmt", "install date", "tank status"]
+        tank_rows = active_tanks.reindex(columns=_TANK_FIELDS, fill_value="N/A")
+        tank_blocks = []
+        tank_records = []
+        for tank_num, clean_num, contents, capacity, install_date, status in tank_rows.itertuples(index=False, name=None):
             # Tank Double Wall (robust): prefer named column and constrain by facility; prefer current/exact row
             double_wall = "No"
-            mat_row = pd.DataFrame()
-            if not usttankmaterials.empty and "clean_tank_number" in usttankmaterials.columns:
-                mat_candidates = usttankmaterials[usttankmaterials["clean_tank_number"] == clean_num]
-                # Narrow by facility if possible
-                if not mat_candidates.empty and "facility id" in mat_candidates.columns:
-                    try:
-                        target_digits = re.sub(r"\D", "", str(facility_id))
-                        ser_digits = mat_candidates["facility id"].astype(str).str.replace(r"\D", "", regex=True)
-                        mr2 = mat_candidates[ser_digits == target_digits]
-                        if not mr2.empty:
-                            mat_candidates = mr2
-                    except Exception:
-                        mr2 = mat_candidates[mat_candidates["facility id"].astype(str).str.strip() == str(facility_id)]
-                        if not mr2.empty:
-                            mat_candidates = mr2
-                elif not mat_candidates.empty and "owner id" in mat_candidates.columns and "owner id" in owner_filtered.columns and not owner_filtered.empty:
-                    try:
-                        oid = str(owner_filtered["owner id"].iloc[-1]).strip()
-                        mr2 = mat_candidates[mat_candidates["owner id"].astype(str).str.strip() == oid]
-                        if not mr2.empty:
-                            mat_candidates = mr2
-                    except Exception:
-                        pass
-                # Prefer exact tank number match over legacy prefixes (e.g., '1' over 'R1')
-                if not mat_candidates.empty and "tank number" in mat_candidates.columns:
-                    exact = mat_candidates[mat_candidates["tank number"].astype(str).str.strip() == str(tank_num)]
-                    if not exact.empty:
-                        mat_candidates = exact
-                # Prefer current in-use status if available
-                if not mat_candidates.empty and "tank status" in mat_candidates.columns:
-                    cur = mat_candidates[mat_candidates["tank status"].astype(str).str.contains("CURR IN USE", case=False, na=False)]
-                    if not cur.empty:
-                        mat_candidates = cur
-                # Choose first remaining
-                mat_row = mat_candidates.head(1)
+            mat_row = narrow_candidates("usttankmaterials", usttankmaterials, clean_num, tank_num)
             # Determine double wall value
             if not mat_row.empty:
-                # Prefer named column
-                dw_col = None
-                for cand in [
-                    "tank material double walled",
-                    "double walled",
-                    "double wall",
-                ]:
-                    if cand in mat_row.columns:
-                        dw_col = cand
-                        break
+                # Prefer the named column (resolved before the loop)
                 if dw_col:
                     double_wall = "Yes" if is_truthy(mat_row.iloc[0][dw_col]) else "No"
                 elif mat_row.shape[1] > 11:
@@ -346,67 +707,21 @@ if facility_input:
             pipe_material = "Unknown"
             piping_type = "Unknown"
             if not ustpipe.empty and "clean_tank_number" in ustpipe.columns:
-                pr_candidates = ustpipe[ustpipe["clean_tank_number"] == clean_num]
-                # Narrow by facility if possible to avoid cross-facility collisions on tank numbers
-                if not pr_candidates.empty and "facility id" in pr_candidates.columns:
-                    try:
-                        target_digits = re.sub(r"\D", "", str(facility_id))
-                        ser_digits = pr_candidates["facility id"].astype(str).str.replace(r"\D", "", regex=True)
-                        pr2 = pr_candidates[ser_digits == target_digits]
-                        if not pr2.empty:
-                            pr_candidates = pr2
-                    except Exception:
-                        pr2 = pr_candidates[pr_candidates["facility id"].astype(str).str.strip() == str(facility_id)]
-                        if not pr2.empty:
-                            pr_candidates = pr2
-                elif not pr_candidates.empty and "owner id" in pr_candidates.columns and "owner id" in owner_filtered.columns and not owner_filtered.empty:
-                    # Fallback: use owner id if facility id is unavailable in ustpipe
-                    try:
-                        oid = str(owner_filtered["owner id"].iloc[-1]).strip()
-                        pr2 = pr_candidates[pr_candidates["owner id"].astype(str).str.strip() == oid]
-                        if not pr2.empty:
-                            pr_candidates = pr2
-                    except Exception:
-                        pass
-                # Prefer exact tank number row over legacy prefixes (e.g., '1' over 'R1')
-                if not pr_candidates.empty and "tank number" in pr_candidates.columns:
-                    exact = pr_candidates[pr_candidates["tank number"].astype(str).str.strip() == str(tank_num)]
-                    if not exact.empty:
-                        pr_candidates = exact
-                # Prefer current in-use status if present
-                if not pr_candidates.empty and "tank status" in pr_candidates.columns:
-                    cur = pr_candidates[pr_candidates["tank status"].astype(str).str.contains("CURR IN USE", case=False, na=False)]
-                    if not cur.empty:
-                        pr_candidates = cur
-                # Choose first remaining
-                pr = pr_candidates.head(1)
-                # Piping Type
-                pt_col = pick(pr, ["pipingtype", "piping type"]) if not pr.empty else None
-                if pt_col:
+                pr = narrow_candidates("ustpipe", ustpipe, clean_num, tank_num)
+                # Piping Type (alias resolved before the loop)
+                if pt_col and not pr.empty:
                     val = str(pr.iloc[0][pt_col]).strip()
                     piping_type = val.title() if val else "Unknown"
-                # Piping Materials
+                # Piping Materials — per-row truthy lists precomputed at load
                 mats = []
-                if not pr.empty:
-                    for col in pr.columns:
-                        cl = str(col).lower()
-                        if cl.startswith("pipe material"):
-                            if is_truthy(pr.iloc[0][col]):
-                                raw = str(col)[len("pipe material"):].strip()
-                                raw = re.sub(r"^[\s:,-]+", "", raw)
-                                # Include "Other Specify" text when present
-                                if raw.lower() == "other":
-                                    spec = ""
-                                    try:
-                                        spec = str(pr.iloc[0].get("pipe material other specify", "")).strip()
-                                    except Exception:
-                                        spec = ""
-                                    if spec:
-                                        mats.append(f"Other ({spec})")
-                                    else:
-                                        mats.append("Other")
-                                else:
-                                    mats.append(raw.title() or "Unknown")
+                if not pr.empty and "_pipe_materials" in pr.columns:
+                    detected = pr.iloc[0]["_pipe_materials"]
+                    if detected:
+                        # "Other Specify" text resolved once for the row
+                        spec = str(pr.iloc[0][spec_col]).strip() if spec_col else ""
+                        other = f"Other ({spec})" if spec else "Other"
+                        mats = [other if raw.lower() == "other" else (raw.title() or "Unknown")
+                                for raw in detected]
                 if mats:
                     pipe_material = ", ".join(mats)
                 else:
@@ -420,10 +735,12 @@ if facility_input:
                                     break
 
             # RD Methods
-            tank_rd = extract_rd(ustpipe_release, clean_num, "tank rd ")
-            pipe_rd = extract_rd(ustpipe_release, clean_num, "pipe rd ")
+            tank_rd = extract_rd(ustpipe_release, clean_num, "_tank_rd_methods", tank_rd_names)
+            pipe_rd = extract_rd(ustpipe_release, clean_num, "_pipe_rd_methods", pipe_rd_names)
+            tank_rd_str = ", ".join(tank_rd) if tank_rd else "Not Listed"
+            pipe_rd_str = ", ".join(pipe_rd) if pipe_rd else "Not Listed"
 
-            st.markdown(
+            tank_blocks.append(
                 f"**Tank #{tank_num}: {contents}**  \n"
                 f"- **Capacity:** {capacity} gallons  \n"
                 f"- **Install Date:** {install_date}  \n"
@@ -432,10 +749,29 @@ if facility_input:
                 f"- **Piping Type:** {piping_type}  \n"
                 f"- **Tank Material:** Fiberglass  \n"
                 f"- **Piping Material:** {pipe_material}  \n"
-                f"**Tank RD Methods:** {', '.join(tank_rd) if tank_rd else 'Not Listed'}  \n"
-                f"**Pipe RD Methods:** {', '.join(pipe_rd) if pipe_rd else 'Not Listed'}"
+                f"**Tank RD Methods:** {tank_rd_str}  \n"
+                f"**Pipe RD Methods:** {pipe_rd_str}"
             )
-            st.markdown("---")
+            tank_records.append({
+                "Tank #": tank_num,
+                "Contents": contents,
+                "Capacity (gal)": capacity,
+                "Install Date": install_date,
+                "Status": status,
+                "Double Wall": double_wall,
+                "Piping Type": piping_type,
+                "Piping Material": pipe_material,
+                "Tank RD Methods": tank_rd_str,
+                "Pipe RD Methods": pipe_rd_str,
+            })
+
+        if len(tank_records) > 10:
+            # Big facility: one Arrow-serialized table, rows virtualized in the
+            # browser instead of a DOM-heavy markdown wall
+            st.dataframe(pd.DataFrame(tank_records), use_container_width=True, hide_index=True)
+        else:
+            # One bridge round-trip for the whole list instead of two per tank
+            st.markdown("\n\n---\n\n".join(tank_blocks))
 
 else:
     st.info("Type a Facility ID, Site Name, or Address to begin.")